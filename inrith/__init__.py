@@ -1,3 +1,3 @@
 """ Interval arithmetic library. """
 
-from . import utils, interval, interval_union, math
+from . import utils, interval, sorted_intervals, interval_union, math
@@ -1,11 +1,11 @@
 """ Real-valued interval. """
 
 from enum import IntEnum
-from typing import Self, SupportsFloat
+from typing import Iterable, Self, SupportsFloat
 from dataclasses import dataclass
-from copy import deepcopy
+from operator import add, sub, mul, truediv, neg
 
-from .utils import bin_op, ifunc
+from .utils import bin_op, ifunc, rpow, INF, NEG_INF
 
 
 BRACKETS_FMT = {
@@ -19,6 +19,9 @@ BRACKETS_FMT = {
     }
 }
 VALUE_DELIMITER = ", "
+# BRACKETS_FMT flattened by side for one lookup per bracket.
+LEFT_BRACKETS = {is_open: BRACKETS_FMT[is_open][-1] for is_open in (True, False)}
+RIGHT_BRACKETS = {is_open: BRACKETS_FMT[is_open][1] for is_open in (True, False)}
 
 
 class Endnotes(IntEnum):
@@ -30,21 +33,13 @@ class Endnotes(IntEnum):
     AUTO = 7
 
 
-SOME_SHIT = {
-    Endnotes.OPENED: (True, True),
-    Endnotes.CLOSED: (False, False),
-    Endnotes.RIGHT_OPEN: (False, True),
-    Endnotes.LEFT_OPEN: (True, False),
-}
-
-
 class EndpointType(IntEnum):
     """ Types of endpoint. """
     INF = -1
     SUP = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Endpoint:
     """ Endpoint of an interval. """
     value: SupportsFloat
@@ -58,9 +53,6 @@ class Endpoint:
         """ Is self.type is supremum? """
         return self.type == EndpointType.SUP
 
-    def __hash__(self):
-        return hash((self.value, self.type))
-
     def __repr__(self):
         return f"({self.value} {self.type})"
 
@@ -68,6 +60,8 @@ class Endpoint:
 class Interval:
     """ Class describing real-valued interval. """
 
+    __slots__ = ("inf", "sup", "left_open", "right_open")
+
     def __init__(
         self,
         infimum: SupportsFloat,
@@ -97,6 +91,56 @@ class Interval:
         self.left_open = self.left_open >= self.left_bounded()
         self.right_open = self.right_open >= self.right_bounded()
 
+    @classmethod
+    def _make(
+        cls,
+        infimum: SupportsFloat,
+        supremum: SupportsFloat,
+        left_open: bool,
+        right_open: bool,
+    ) -> Self:
+        """ Fast constructor bypassing __init__ checks. Caller must ensure that
+            infimum <= supremum, both endpoints share one type
+            and unbounded ends are opened.
+        """
+        obj = cls.__new__(cls)
+        obj.inf, obj.sup = infimum, supremum
+        obj.left_open, obj.right_open = left_open, right_open
+        return obj
+
+    @classmethod
+    def _closed(cls, infimum: SupportsFloat, supremum: SupportsFloat) -> Self:
+        """ Fast constructor of closed interval with infinite ends opened.
+            Endpoints of different types are promoted to float as in __init__.
+            Caller must ensure that infimum <= supremum.
+        """
+        if type(infimum) is not type(supremum):
+            infimum, supremum = float(infimum), float(supremum)
+        return cls._make(infimum, supremum, infimum == NEG_INF, supremum == INF)
+
+    @classmethod
+    def from_bounds(
+        cls,
+        infimums: Iterable[SupportsFloat],
+        supremums: Iterable[SupportsFloat],
+    ) -> list[Self]:
+        """ Return closed intervals made of pairwise infimums and supremums
+            in one pass. Each infimum has to be <= its supremum.
+            Endpoints of different types are promoted to float as in __init__.
+        """
+        # Body of _closed inlined into the loop to save a call per interval.
+        new = cls.__new__
+        intervals = []
+        append = intervals.append
+        for inf, sup in zip(infimums, supremums):
+            if type(inf) is not type(sup):
+                inf, sup = float(inf), float(sup)
+            obj = new(cls)
+            obj.inf, obj.sup = inf, sup
+            obj.left_open, obj.right_open = inf == NEG_INF, sup == INF
+            append(obj)
+        return intervals
+
     def endpoints(self) -> tuple[Endpoint]:
         """ Return the endpoints of self in form
             (infimum endpoint, supremum endpoint).
@@ -104,22 +148,27 @@ class Interval:
         return (Endpoint(self.inf, EndpointType.INF), Endpoint(self.sup, EndpointType.SUP))
 
     def infsup(self) -> tuple[SupportsFloat]:
-        """ Return infimum and supremum of self in form (inf., sup.). """
+        """ Return infimum and supremum of self in form (inf., sup.).
+            Prefer reading inf and sup directly in hot code.
+        """
         return (self.inf, self.sup)
 
     def as_closed(self) -> Self:
         """ Return interval as closed. """
-        return Interval(self.inf, self.sup, Endnotes.CLOSED)
+        return Interval._make(
+            self.inf, self.sup,
+            not self.left_bounded(), not self.right_bounded(),
+        )
 
     def as_opened(self) -> Self:
         """ Return interval as opened. """
-        return Interval(self.inf, self.sup, Endnotes.OPENED)
+        return Interval._make(self.inf, self.sup, True, True)
 
     def to_float_ends(self) -> Self:
         """ Casts interval endpoints to float type. """
-        cpy = deepcopy(self)
-        cpy.inf, cpy.sup = float(cpy.inf), float(cpy.sup)
-        return cpy
+        return Interval._make(
+            float(self.inf), float(self.sup), self.left_open, self.right_open,
+        )
     
     def empty(self) -> bool:
         """ Return if interval is empty set. """
@@ -127,11 +176,11 @@ class Interval:
 
     def left_bounded(self) -> bool:
         """ Return left boundness of interval. """
-        return self.inf > -float("inf") or self.empty()
+        return self.inf > NEG_INF or self.empty()
 
     def right_bounded(self) -> bool:
         """ Return right boundness of interval. """
-        return self.sup < float("inf") or self.empty()
+        return self.sup < INF or self.empty()
 
     def bounded(self) -> bool:
         """ Return boundness of interval. """
@@ -152,53 +201,61 @@ class Interval:
         return type(self.inf)
 
     def __contains__(self, value: SupportsFloat):
-        # Don't know such a good way to do this without ifs and using less code.
-        # It'd better if there's way to get operators depending of openness of interval.
-        cond1 = self.inf <= value <= self.sup
-        cond2 = not (value == self.inf and self.left_open)
-        cond3 = not (value == self.sup and self.right_open)
-
-        return cond1 and cond2 and cond3
+        # Openness matters only at endpoints, so check it after the range.
+        inf, sup = self.inf, self.sup
+        if not inf <= value <= sup:
+            return False
+        if value == inf and self.left_open:
+            return False
+        if value == sup and self.right_open:
+            return False
+        return True
+
+    def __copy__(self):
+        return Interval._make(self.inf, self.sup, self.left_open, self.right_open)
 
     def __repr__(self):
-        if self.empty():
+        # Inlined self.empty() as unions format every interval.
+        if (self.left_open or self.right_open) and self.inf == self.sup:
             return "∅"
 
-        lb = BRACKETS_FMT[self.left_open][-1]
-        rb = BRACKETS_FMT[self.right_open][1]
+        lb = LEFT_BRACKETS[self.left_open]
+        rb = RIGHT_BRACKETS[self.right_open]
         return f"{lb}{self.inf}{VALUE_DELIMITER}{self.sup}{rb}"
 
     def __hash__(self):
         return hash((self.inf, self.sup, self.left_open, self.right_open))
 
     def __eq__(self, other: Self):
-        return all((
-            self.inf == other.inf,
-            self.sup == other.sup,
-            self.left_open == other.left_open,
-            self.right_open == other.right_open,
-        ))
+        if type(other) is not Interval:
+            return NotImplemented
+        return (
+            self.inf == other.inf
+            and self.sup == other.sup
+            and self.left_open == other.left_open
+            and self.right_open == other.right_open
+        )
 
     def __add__(self, other) -> Self:
-        return self.__overload_bin_op(other, "__add__")
+        return self.__overload_bin_op(other, ADD)
 
     def __radd__(self, other) -> Self:
         return self.__add__(other)
 
     def __sub__(self, other) -> Self:
-        return self.__overload_bin_op(other, "__sub__")
+        return self.__overload_bin_op(other, SUB)
 
     def __rsub__(self, other) -> Self:
         return (-self).__add__(other)
 
     def __mul__(self, other) -> Self:
-        return self.__overload_bin_op(other, "__float__")
+        return self.__overload_bin_op(other, MUL)
 
     def __rmul__(self, other) -> Self:
         return self.__mul__(other)
 
     def __truediv__(self, other) -> Self:
-        return self.__overload_bin_op(other, "__truediv__")
+        return self.__overload_bin_op(other, DIV)
 
     def __rtruediv__(self, other) -> Self:
         if isinstance(other, (int, float)):
@@ -206,22 +263,24 @@ class Interval:
         return other.__truediv__(self)
 
     def __rpow__(self, other: SupportsFloat) -> Self:
-        return ifunc(lambda val: other**val)(self)
+        return ifunc(rpow)(self, other)
 
     def __pow__(self, other: int) -> Self:
         if self.inf < 0 and self.sup > 0 and other % 2 == 0:
             return Interval(0, max(self.inf**other, self.sup**other))
-        return ifunc(lambda val: val**other)(self)
+        return ifunc(pow)(self, other)
 
     def __neg__(self) -> Self:
-        return ifunc(lambda val: -val)(self)
+        return ifunc(neg)(self)
 
     def __and__(self, other: Self) -> Self:
         # TODO can we do something with that?
-        if self <= other:
+        if self.issubset(other):
             return self
-        if other <= self:
+        if other.issubset(self):
             return other
+        # Ends may come from intervals of different types,
+        # so __init__ is needed to promote them.
         if self.sup in other:
             return Interval(
                 other.inf, self.sup,
@@ -234,9 +293,24 @@ class Interval:
             )
         return Common.EMPTY
 
+    def __lt__(self, other: Self) -> bool:
+        if type(other) is not Interval:
+            return NotImplemented
+        if self.inf == other.inf:
+            return self.sup < other.sup
+        return self.inf < other.inf
+
     def __le__(self, other: Self) -> bool:
+        if type(other) is not Interval:
+            return NotImplemented
+        if self.inf == other.inf:
+            return self.sup <= other.sup
+        return self.inf < other.inf
+
+    def issubset(self, other: Self) -> bool:
+        """ Return if self is subset of other. """
         # [inf,sup]_aux_cond are needed for half or opened intervals.
-        # E.g. for checking [0, +oo) <= (-oo, +oo), because +oo not in (-oo, +oo).
+        # E.g. for checking [0, +oo) is subset of (-oo, +oo), because +oo not in (-oo, +oo).
         inf_aux_cond = (self.inf == other.inf) and (self.left_open == other.left_open)
         sup_aux_cond = (self.sup == other.sup) and (self.right_open == other.right_open)
         return (
@@ -244,41 +318,48 @@ class Interval:
             and (self.sup in other or sup_aux_cond)
         )
 
+    def __len__(self):
+        return 1
+
     def __iter__(self):
-        yield self
+        return iter((self,))
 
     def __getitem__(self, _: int):
         return self
 
     def __setitem__(self, index: int, val: Self):
-        self.__dict__ = val.__dict__
+        for attr in Interval.__slots__:
+            setattr(self, attr, getattr(val, attr))
 
     def __handle_endnotes(self, endnotes: Endnotes) -> None:
         """ Handle type of interval's endpoints and set right and left openness."""
         if endnotes == Endnotes.AUTO:
-            self.left_open = abs(self.inf) == float("inf")
-            self.right_open = abs(self.sup) == float("inf")
+            self.left_open = abs(self.inf) == INF
+            self.right_open = abs(self.sup) == INF
+        elif endnotes == Endnotes.CLOSED:
+            self.left_open, self.right_open = False, False
+        elif endnotes == Endnotes.OPENED:
+            self.left_open, self.right_open = True, True
+        elif endnotes == Endnotes.RIGHT_OPEN:
+            self.left_open, self.right_open = False, True
+        elif endnotes == Endnotes.LEFT_OPEN:
+            self.left_open, self.right_open = True, False
         else:
-            try:
-                self.left_open, self.right_open = SOME_SHIT[endnotes]
-            except KeyError as exc:
-                raise KeyError("Unsupported endnote.") from exc
-
+            raise KeyError("Unsupported endnote.")
 
-    def __to_mutual_type(self, other: Self) -> tuple[Self, Self]:
-        if self.ends_type() == float or other.ends_type() == float:
-            return (self.to_float_ends(), other.to_float_ends(), float)
-        return (self, other, int)
-
-    def __overload_bin_op(self, other, op_name) -> Self:
+    def __overload_bin_op(self, other, wrapper) -> Self:
         """ Convinient usage in operator overloading. """
         if isinstance(other, (int, float)):
             other = Interval(other, other)
-        casted_new, casted_other, ends_type = self.__to_mutual_type(other)
-        return bin_op(getattr(ends_type, op_name))(casted_new, casted_other)
+        return wrapper(self, other)
+
+
+# Wrappers for arithmetic operators are resolved once
+# instead of looking up bin_op cache on every operation.
+ADD, SUB, MUL, DIV = (bin_op(op) for op in (add, sub, mul, truediv))
 
 
 class Common:
     """ Common intervals. """
     EMPTY = Interval(0, 0, Endnotes.OPENED)
-    REALS = Interval(float("-inf"), float("inf"))
+    REALS = Interval(NEG_INF, INF)
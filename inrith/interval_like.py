@@ -7,11 +7,11 @@ from .interval import Interval
 class IntervalLike(Protocol):
     """ For convinient using in math functions. """
 
-    def __iter__(self) -> Iterator[Interval]:
+    def __len__(self) -> int:
         ...
 
-    def __getitem__(self, index: int) -> Interval:
+    def __iter__(self) -> Iterator[Interval]:
         ...
 
-    def __setitem__(self, index: int, val: Interval):
+    def __getitem__(self, index: int) -> Interval:
         ...
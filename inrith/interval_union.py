@@ -1,56 +1,128 @@
 """ Union of real-valued intervals. """
 
-from typing import Iterable
+from typing import Iterable, Self, SupportsFloat
+from copy import copy
+import heapq
+from itertools import islice
 from operator import attrgetter
 
-from .interval import Interval, Endpoint
+from .interval import Interval
+from .sorted_intervals import SortedIntervals
 
 INTERVALS_DELIMITER = " ∪ "
 
 
+def sweep_union(infs: list, sups: list) -> tuple[list, list]:
+    """ Merge closed intervals given by parallel lists of infimums and
+        supremums. Return the same lists for disjoint union sorted
+        in ascending order. Input lists may be sorted in place.
+    """
+    if not infs:
+        return [], []
+
+    # Infimums and supremums are sorted separately. After k-th supremum
+    # exactly k+1 intervals are closed, and at least k+1 are opened,
+    # so union breaks there iff (k+1)-th infimum is strictly greater.
+    # Touching intervals are fused.
+    infs.sort()
+    sups.sort()
+    res_infs, res_sups = [infs[0]], []
+    for sup, next_inf in zip(sups, islice(infs, 1, None)):
+        if next_inf > sup:
+            res_sups.append(sup)
+            res_infs.append(next_inf)
+    res_sups.append(sups[-1])
+
+    return res_infs, res_sups
+
+
+def scan_union(infs: list, sups: list) -> tuple[list, list]:
+    """ Same as sweep_union, but in O(n) for infimums already sorted
+        in ascending order. Supremums may go in any order.
+    """
+    if not infs:
+        return [], []
+
+    res_infs, res_sups = [], []
+    curr_inf, curr_sup = infs[0], sups[0]
+    for inf, sup in zip(infs, sups):
+        if inf > curr_sup:
+            res_infs.append(curr_inf)
+            res_sups.append(curr_sup)
+            curr_inf, curr_sup = inf, sup
+        elif sup > curr_sup:
+            curr_sup = sup
+    res_infs.append(curr_inf)
+    res_sups.append(curr_sup)
+
+    return res_infs, res_sups
+
+
 class IntervalUnion:
     """ Union of some intervals. Provides disjointness. """
 
     # TODO need to keep intervals endnotes as is.
-    def __init__(self, intervals: Iterable[Interval]):
-        """ Reduce over intervals to form the union. """
-        unique_intervals = tuple(set(i.as_closed() for i in intervals))
-        endpoints = self.__get_endpoints(unique_intervals)
-
-        # TODO such a tardy algorithm with O(n**2) complexity.
-        # Think can be improved to O(n*log(n)) with interval trees.
-        self.intervals = []
-        curr_inf = None
-        for endpoint in endpoints:
-            in_count = 0
-            for i in unique_intervals:
-                in_count += endpoint.value in i.as_closed()
-
-            if in_count == 1:
-                if endpoint.is_inf():
-                    curr_inf = endpoint.value
-                elif endpoint.is_sup():
-                    self.intervals.append(Interval(curr_inf, endpoint.value))
-                    curr_inf = None
-
-            if curr_inf is None:
-                curr_inf = endpoint.value
+    def __init__(self, intervals: Iterable[Interval], *, assume_sorted: bool = False):
+        """ Sweep over sorted endpoints to form the union. If assume_sorted,
+            intervals have to go in ascending order of infimums,
+            then sorting is skipped.
+        """
+        # Read endpoints of every interval once into flat lists.
+        # Inlined not i.empty() as it's called for every interval.
+        infs, sups = [], []
+        for i in intervals:
+            inf, sup = i.inf, i.sup
+            if inf != sup or not (i.left_open or i.right_open):
+                infs.append(inf)
+                sups.append(sup)
+
+        # Sweep output is already disjoint and sorted, so no fusing needed.
+        merge = scan_union if assume_sorted else sweep_union
+        self.storage = SortedIntervals.from_bounds(*merge(infs, sups))
+
+    @classmethod
+    def _from_sorted(cls, storage: SortedIntervals) -> Self:
+        """ Wrap sorted disjoint intervals without sweeping. """
+        obj = cls.__new__(cls)
+        obj.storage = storage
+        return obj
+
+    @property
+    def intervals(self) -> list[Interval]:
+        """ Disjoint intervals of union sorted by infimum. """
+        return self.storage.intervals
+
+    def add(self, interval: Interval) -> None:
+        """ Add interval to union in place fusing it with overlapping ones.
+            It's O(log(n)) search plus O(n) list shift per insert, since
+            storage is a plain sorted list rather than a balanced structure.
+        """
+        self.storage.add(interval)
+
+    def union(self, other: Self) -> Self:
+        """ Return union of self and other. Both are already sorted, so their
+            intervals are merged and scanned in O(n+m) without sorting.
+        """
+        infs, sups = [], []
+        for i in heapq.merge(self, other, key=attrgetter("inf")):
+            infs.append(i.inf)
+            sups.append(i.sup)
+        return IntervalUnion._from_sorted(SortedIntervals.from_bounds(*scan_union(infs, sups)))
 
     def __repr__(self):
-        return INTERVALS_DELIMITER.join(map(str, self.intervals))
+        return INTERVALS_DELIMITER.join(map(repr, self.intervals))
 
-    def __iter__(self):
-        for i in self.intervals:
-            yield i
+    def __copy__(self):
+        return IntervalUnion._from_sorted(SortedIntervals(map(copy, self.storage)))
 
-    def __getitem__(self, index: int):
-        return self.intervals[index]
+    def __contains__(self, value: SupportsFloat):
+        return value in self.storage
 
-    def __setitem__(self, index: int, val: Interval):
-        self.intervals[index] = val
+    def __len__(self):
+        return len(self.storage)
 
-    def __get_endpoints(self, intervals: Iterable[Interval]) -> list[Endpoint]:
-        endpoints = set()
-        for i in intervals:
-            endpoints.update(i.endpoints())
-        return sorted(endpoints, key=attrgetter("value"))
+    def __iter__(self):
+        return iter(self.storage)
+
+    def __getitem__(self, index: int):
+        return self.storage[index]
@@ -1,45 +1,69 @@
 """ Math function applicable to intervals. """
 
 import math
-from copy import deepcopy
+from typing import Callable
 
 from .utils import ifunc
+from .interval import Interval
+from .interval_union import IntervalUnion
 from .interval_like import IntervalLike
 
-PI, TAU = math.pi, 2*math.pi
+PI, TAU, HALF_PI = math.pi, 2*math.pi, 0.5*math.pi
+
+
+def drifted_log(x: float, base: float) -> float:
+    """ Log function which drifts to infinity at non-positive values. """
+    return math.log(x, base) if x > 0 else math.copysign(1., base - 1)*math.inf
+
+
+def map_intervals(interval_like: IntervalLike, func: Callable[[Interval], Interval]) -> IntervalLike:
+    """ Apply func to every interval of interval like object. Union is
+        rebuilt, since mapped intervals may overlap or go out of order.
+    """
+    if isinstance(interval_like, Interval):
+        return func(interval_like)
+    return IntervalUnion(map(func, interval_like))
 
 
 def log(interval_like: IntervalLike, base: float = math.e) -> IntervalLike:
     """ Log function over interval like object with extra drifting. """
 
-    i_cpy = deepcopy(interval_like)
-    func = ifunc(lambda x, base: (
-        math.log(x, base) if x > 0 else math.copysign(1., base - 1)*math.inf
-    ))
-    for idx, i in enumerate(interval_like):
-        i_cpy[idx] = func(i, base)
+    func = ifunc(drifted_log)
+    return map_intervals(interval_like, lambda i: func(i, base))
+
 
-    return i_cpy
+def cos_bounds(inf: float, sup: float) -> tuple[float, float]:
+    """ Bounds of cosine over closed interval [inf, sup]. Openness doesn't
+        matter here, since at an excluded extremum cosine is still 1 or -1.
+    """
+    lo, hi = math.cos(inf), math.cos(sup)
+    if lo > hi:
+        lo, hi = hi, lo
+
+    if inf <= TAU * math.ceil(inf / TAU) <= sup:
+        hi = 1.
+    if inf <= TAU * math.ceil((inf - PI) / TAU) + PI <= sup:
+        lo = -1.
+    return lo, hi
 
 
 def cos(interval_like: IntervalLike) -> IntervalLike:
     """ Cosine function over interval like object. """
 
-    i_cpy = deepcopy(interval_like)
-    func = ifunc(math.cos)
-    for idx, i in enumerate(interval_like):
-        i_cpy[idx] = func(i)
-
-        next_max = TAU * math.ceil(i.inf / TAU)
-        next_min = TAU * math.ceil((i.inf - PI) / TAU) + PI
-        if next_max in i:
-            i_cpy[idx].sup = 1.
-        if next_min in i:
-            i_cpy[idx].inf = -1.
+    def func(i: Interval) -> Interval:
+        inf, sup = cos_bounds(i.inf, i.sup)
+        return Interval._make(inf, sup, i.left_open, i.right_open)
 
-    return i_cpy
+    return map_intervals(interval_like, func)
 
 
 def sin(interval_like: IntervalLike) -> IntervalLike:
     """ Sine function over interval like object. """
-    return cos(0.5*PI - interval_like)
+
+    # sin(x) = cos(x - pi/2) shifts every interval by a scalar,
+    # so interval unions don't need interval arithmetic.
+    def func(i: Interval) -> Interval:
+        inf, sup = cos_bounds(i.inf - HALF_PI, i.sup - HALF_PI)
+        return Interval._make(inf, sup, i.left_open, i.right_open)
+
+    return map_intervals(interval_like, func)
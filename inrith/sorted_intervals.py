@@ -0,0 +1,77 @@
+""" Sorted storage of disjoint real-valued intervals. """
+
+from bisect import bisect_right
+from typing import Iterable, Self, SupportsFloat
+
+from .interval import Interval
+
+
+class SortedIntervals:
+    """ Disjoint closed intervals kept in a list sorted by infimum.
+        Overlapping or touching intervals are fused on insertion.
+        Lookups are bisections, but insertions shift the list.
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        """ Take intervals that are already disjoint and sorted by infimum. """
+        self.intervals = list(intervals)
+        self.__infs = [i.inf for i in self.intervals]
+
+    @classmethod
+    def from_bounds(cls, infs: list, sups: list) -> Self:
+        """ Make closed intervals from bounds that are already
+            disjoint and sorted. infs list is taken over by the result.
+        """
+        obj = cls.__new__(cls)
+        obj.intervals = Interval.from_bounds(infs, sups)
+        obj.__infs = infs
+        return obj
+
+    def add(self, interval: Interval) -> None:
+        """ Insert interval fusing it with all overlapping or touching ones.
+            It's O(log(n)) search plus O(n) list shift.
+        """
+        if interval.empty():
+            return
+
+        inf, sup = interval.inf, interval.sup
+        infs = self.__infs
+
+        # Only the last interval starting before inf can reach it,
+        # the following ones overlap while they start before sup.
+        start = bisect_right(infs, inf)
+        if start and self.intervals[start - 1].sup >= inf:
+            start -= 1
+        stop = bisect_right(infs, sup, start)
+
+        if start < stop:
+            inf = min(inf, infs[start])
+            sup = max(sup, self.intervals[stop - 1].sup)
+        self.intervals[start:stop] = (Interval._closed(inf, sup),)
+        infs[start:stop] = (inf,)
+
+    def find(self, value: SupportsFloat) -> Interval | None:
+        """ Return interval containing value or None in O(log(n)). """
+        index = bisect_right(self.__infs, value) - 1
+        if index >= 0 and value in self.intervals[index]:
+            return self.intervals[index]
+        return None
+
+    def copy(self) -> Self:
+        """ Return shallow copy of self. """
+        cpy = SortedIntervals.__new__(SortedIntervals)
+        cpy.intervals = self.intervals.copy()
+        cpy.__infs = self.__infs.copy()
+        return cpy
+
+    def __contains__(self, value: SupportsFloat):
+        return self.find(value) is not None
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def __iter__(self):
+        return iter(self.intervals)
+
+    def __getitem__(self, index: int):
+        return self.intervals[index]
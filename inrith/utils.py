@@ -1,13 +1,67 @@
 """ Utils. """
 
-import itertools
 from typing import Callable, SupportsFloat, TypeVar
 from functools import cache
+from operator import add, sub, mul, truediv
 
 BinaryFunction = Callable[[SupportsFloat, SupportsFloat], SupportsFloat]
+Bounds = tuple[SupportsFloat, SupportsFloat]
 T = TypeVar("T")
 
+INF = float("inf")
+NEG_INF = -INF
 
+
+def add_bounds(l_inf, l_sup, r_inf, r_sup) -> Bounds:
+    """ Bounds of sum. It's increasing by both arguments. """
+    return (l_inf + r_inf, l_sup + r_sup)
+
+
+def sub_bounds(l_inf, l_sup, r_inf, r_sup) -> Bounds:
+    """ Bounds of difference. It's increasing by lhs and decreasing by rhs. """
+    return (l_inf - r_sup, l_sup - r_inf)
+
+
+def mul_bounds(l_inf, l_sup, r_inf, r_sup) -> Bounds:
+    """ Bounds of product. """
+    v00, v01 = l_inf*r_inf, l_inf*r_sup
+    v10, v11 = l_sup*r_inf, l_sup*r_sup
+    return (min(v00, v01, v10, v11), max(v00, v01, v10, v11))
+
+
+def div_bounds(l_inf, l_sup, r_inf, r_sup) -> Bounds:
+    """ Bounds of quotient. """
+    v00, v01 = l_inf/r_inf, l_inf/r_sup
+    v10, v11 = l_sup/r_inf, l_sup/r_sup
+    return (min(v00, v01, v10, v11), max(v00, v01, v10, v11))
+
+
+def monotone_bounds(operator: BinaryFunction) -> Callable[..., Bounds]:
+    """ Return bounds function for arbitrary monotonic binary operator. """
+
+    def bounds(l_inf, l_sup, r_inf, r_sup) -> Bounds:
+        v00, v01 = operator(l_inf, r_inf), operator(l_inf, r_sup)
+        v10, v11 = operator(l_sup, r_inf), operator(l_sup, r_sup)
+        return (min(v00, v01, v10, v11), max(v00, v01, v10, v11))
+
+    return bounds
+
+
+def rpow(exponent: SupportsFloat, base: SupportsFloat) -> SupportsFloat:
+    """ Power with swapped arguments to raise base to interval endpoints. """
+    return base**exponent
+
+
+OPERATOR_BOUNDS = {
+    add: add_bounds,
+    sub: sub_bounds,
+    mul: mul_bounds,
+    truediv: div_bounds,
+}
+
+
+# Note that bin_op and ifunc are cached by function identity, so pass
+# module level functions to them rather than lambdas created per call.
 @cache
 def bin_op(operator: BinaryFunction) -> Callable:
     """ Returns function that takes 2 intervals and performs binary operator
@@ -17,18 +71,17 @@ def bin_op(operator: BinaryFunction) -> Callable:
 
     from .interval import Interval
 
+    # Arithmetic operators have specialized bounds,
+    # e.g. sum needs 2 evaluations instead of 4.
+    bounds = OPERATOR_BOUNDS.get(operator) or monotone_bounds(operator)
+
     def wrapper(lhs: Interval, rhs: Interval) -> Interval:
-        map_op = lambda v: operator(*v)
-        cart_prod = itertools.product(lhs.infsup(), rhs.infsup())
-        vals = tuple(map(map_op, cart_prod))
-        left_open = lhs.left_open or rhs.left_open
-        right_open = lhs.right_open or rhs.right_open
+        inf, sup = bounds(lhs.inf, lhs.sup, rhs.inf, rhs.sup)
+        # Result can overflow to infinity which has to be opened.
+        left_open = lhs.left_open or rhs.left_open or inf == NEG_INF
+        right_open = lhs.right_open or rhs.right_open or sup == INF
 
-        return Interval(
-            min(vals), max(vals),
-            left_open=left_open,
-            right_open=right_open,
-        )
+        return Interval._make(inf, sup, left_open, right_open)
 
     return wrapper
 
@@ -43,9 +96,11 @@ def ifunc(func: Callable[[SupportsFloat, ...], SupportsFloat]) -> Callable:
     from .interval import Interval
 
     def wrapper(interval: Interval, *args) -> Interval:
-        vals = tuple(func(i, *args) for i in interval.infsup())
+        v_inf = func(interval.inf, *args)
+        v_sup = func(interval.sup, *args)
+        inf, sup = (v_inf, v_sup) if v_inf <= v_sup else (v_sup, v_inf)
         return Interval(
-            min(vals), max(vals),
+            inf, sup,
             left_open=interval.left_open,
             right_open=interval.right_open,
         )